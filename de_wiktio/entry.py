@@ -3,16 +3,198 @@ This module provides methods to parse *wikitext* and extract data from Wiktionar
 """ 
 # %%
 from __future__ import annotations
-import mwparserfromhell
 from mwparserfromhell.wikicode import Wikicode
 from mwparserfromhell.nodes.heading import Heading
+from mwparserfromhell.nodes import Node, Text
 from mwparserfromhell.nodes.template import Template
+from mwparserfromhell.smart_list import SmartList
+from mwparserfromhell.parser import Parser, use_c
 
-from de_wiktio.fetch import  PageExport, WikiDump
+from de_wiktio.fetch import  PageExport, WikiDump, WikiDumpMmap
 
-from typing import List, Optional, Dict, Self
-from pathlib import Path
+from typing import Iterable, List, Optional, Dict, Mapping, Self
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import itertools
 import re
+import threading
+import warnings
+from array import array
+from enum import IntEnum
+
+if not use_c:
+    warnings.warn("mwparserfromhell is using its pure-Python tokenizer, which is much slower than the C tokenizer. "
+                  "Reinstall mwparserfromhell from a wheel or with a C compiler available to enable it.",
+                  RuntimeWarning)
+
+
+class _Missing:
+    """Type of the `_MISSING` sentinel, which stays the same object when pickled."""
+
+    def __reduce__(self) -> str:
+        return '_MISSING'
+
+
+_MISSING = _Missing()
+"""Sentinel of the lazy attributes that are not computed yet."""
+
+_PARSERS = threading.local()
+"""Per-thread `Parser`, as parsers are not thread-safe."""
+
+
+def _parse(text: Optional[str]) -> Wikicode:
+    """Parse *wikitext* reusing the `Parser` of the current thread, instead of creating one per call as `mwparserfromhell.parse` does."""
+    parser = getattr(_PARSERS, 'parser', None)
+    if parser is None:
+        parser = _PARSERS.parser = Parser()
+    return parser.parse(text or '')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(text: str) -> Wikicode:
+    """Parse *wikitext* with `_parse`, memoized by the *wikitext* itself.
+
+    The returned `Wikicode` is shared by all the callers with the same *wikitext*, so it must not be modified.
+    """
+    return _parse(text)
+
+_POS_RE = re.compile(r"(Adjektiv|Verb|Adverb|Gerundivum|Numerale)")
+"""Pattern matching the POS in the name of the flexion templates."""
+
+_FLEX_POS_RE = re.compile(r"\{\{[^{}|]*?(Adjektiv|Verb|Adverb|Gerundivum|Numerale)")
+"""Pattern matching the POS in the name of a flexion template in the *wikitext*."""
+
+# Headings in the wikitext: the German (level 2) heading and any heading
+_DE_HEADING_RE = re.compile(r"^==[^=\n].*\|Deutsch.*==[ \t]*$", re.MULTILINE | re.IGNORECASE)
+_HEADING_RE = re.compile(r"^(=+)[^=\n].*=[ \t]*$", re.MULTILINE)
+
+# Heading patterns, with the flags mwparserfromhell uses for string matches
+_DE_MATCH = re.compile(r"\|Deutsch", re.IGNORECASE | re.DOTALL)
+_WORTART_MATCH = re.compile(r"Wortart", re.IGNORECASE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=64)
+def _content_re(name: str) -> re.Pattern:
+    """Compiled pattern for the paragraph introduced by the template `name`."""
+    return re.compile(r'\n\n\{\{' + re.escape(name) + r'\}\}\n(.+?)\n\n', re.DOTALL)
+
+
+@functools.lru_cache
+def _contents_re(names: tuple[str, ...]) -> re.Pattern:
+    """Compiled pattern for the paragraphs introduced by any of the templates `names`.
+
+    The whole pattern is a lookahead, so that matches can overlap as with separate searches for each name.
+    """
+    alternatives = '|'.join(re.escape(name) for name in names)
+    return re.compile(r'(?=\n\n\{\{(' + alternatives + r')\}\}\n(.+?)\n\n)', re.DOTALL)
+
+
+def _tpl_name(template: Template) -> str:
+    """The stripped name of a template."""
+    return str(template.name).strip()
+
+
+def _classify(name: str) -> Optional[str]:
+    """Category of a template from its name: `'wortart'`, `'übersicht'` or `None`.
+
+    The name is matched case-insensitively, like `filter_templates(matches=...)` does, as MediaWiki ignores the case of the first letter of template names.
+    """
+    name = name.casefold()
+    if 'wortart' in name:
+        return 'wortart'
+    if 'übersicht' in name:
+        return 'übersicht'
+    return None
+
+
+class Status(IntEnum):
+    """Status codes of the parsing and extraction of entries and word forms.
+
+    `Status.OK` is `0`, so any failure is truthy. The human-readable message of a status is built on demand with `message`.
+
+    In previous versions, the status was the message string itself. For backward compatibility, a status compares equal to the messages it stood for, e.g. `Status.OK == 'OK'` and `Status.NO_POS == 'No POS found for Haus'`, with a `DeprecationWarning`.
+    """
+    OK = 0
+    NO_EXPORT_CONTENT = 1
+    BAD_NS = 2
+    NO_DUMP_CONTENT = 3
+    MULTI_DE = 4
+    NO_DE = 5
+    NO_WORDFORMS = 6
+    NO_POS = 7
+    MULTI_POS = 8
+    NO_WORTART = 9
+    NO_FLEX = 10
+    MULTI_FLEX = 11
+
+    def __str__(self) -> str:
+        return self.name
+
+    def _matches(self, message: str) -> bool:
+        warnings.warn('Comparing a Status with a message string is deprecated. Please compare with the Status codes, e.g. Status.OK',
+                      DeprecationWarning, stacklevel=3)
+        return _STATUS_PATTERNS[self].fullmatch(message) is not None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, str):
+            return self._matches(other)
+        return int.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, str):
+            return not self._matches(other)
+        return int.__ne__(self, other)
+
+    __hash__ = IntEnum.__hash__
+
+    def message(self, title: str) -> str:
+        """The message of the status for the page or word form `title`."""
+        return _STATUS_MESSAGES[self].format(title)
+
+    @classmethod
+    def from_message(cls, message: str) -> 'Status':
+        """The status of a message string, as used for the status in previous versions, e.g. `'OK'` or `'No content for Haus in dump file'`.
+
+        Raises:
+            ValueError: If the message does not match any status.
+        """
+        for status, pattern in _STATUS_PATTERNS.items():
+            if pattern.fullmatch(message):
+                return status
+        raise ValueError(f'Unknown status message {message!r}. Please use a Status code, e.g. Status.OK')
+
+
+_STATUS_MESSAGES: Dict[Status, str] = {
+    Status.OK: 'OK',
+    Status.NO_EXPORT_CONTENT: 'No content for {} in exported page',
+    Status.BAD_NS: 'No proper wiki namespace found for {}',
+    Status.NO_DUMP_CONTENT: 'No content for {} in dump file',
+    Status.MULTI_DE: 'More than one German section found for {}',
+    Status.NO_DE: 'No German section found for {}',
+    Status.NO_WORDFORMS: 'No German word forms for {}',
+    Status.NO_POS: 'No POS found for {}',
+    Status.MULTI_POS: 'Multiple POS found for {}',
+    Status.NO_WORTART: 'No Wortart template found for {}',
+    Status.NO_FLEX: 'No German flexion templates',
+    Status.MULTI_FLEX: 'Multiple German flexion templates',
+}
+
+_STATUS_PATTERNS: Dict[Status, re.Pattern] = {
+    status: re.compile(re.escape(message).replace(r'\{\}', '.*'), re.DOTALL)
+    for status, message in _STATUS_MESSAGES.items()}
+"""Patterns matching the messages of the statuses, for any title."""
+
+
+_WIKIDICTS: Dict[str, WikiDumpMmap] = {}
+"""Registry of the opened dictionaries, by wiki namespace."""
+
+
+class _WikiDictProxy:
+    """Descriptor exposing the dictionary of the registry for the `NS` of the class."""
+
+    def __get__(self, obj, owner) -> Optional[WikiDumpMmap]:
+        return _WIKIDICTS.get(owner.NS)
+
  
 class _EntryBase:
     """Base class for parsing the *wikitex* of a Wiktionary page.
@@ -22,7 +204,9 @@ class _EntryBase:
     So the approach here is to use EntryBase as a base class to create subclasses for each namespace `NS`. The specific `NS` of the subclass is defined in the 'NS' class attribute.
 
     """
-    WIKIDICT = None
+    __slots__ = ('title', 'text', 'status', 'extracted_from', 'german', '_parsed')
+
+    WIKIDICT = _WikiDictProxy()
     NS = '0'
 
     # doctring Class attributes
@@ -30,11 +214,13 @@ class _EntryBase:
     """Class attribute: The wiki namespace identifier. 
     Each subclass should define its own `NS` value."""
 
-    WIKIDICT: dict
-    """Class attribute: Dictionary of title-wikitext pairs.
+    WIKIDICT: WikiDumpMmap
+    """Class attribute: Memory-mapped dictionary of title-wikitext pairs.
+
+    The dictionary is bytes-keyed: titles and wikitexts are stored *utf-8* encoded and decoded only on access.
     
     To be accessed when using the `from_dump` class method. 
-    This is a lazy attribute. It loads the dictionary when needed. After that, it is kept in memory as a class attribute so that the dictionary is not loaded multiple times when using the `from_dump` class method to create a new `Entry` object."""
+    This is a lazy attribute. It opens the dictionary when needed. After that, it is kept in a module-level registry by `NS`, so that the dictionary is not opened multiple times when using the `from_dump` class method to create a new `Entry` object, and the class itself holds no reference to it. Only the pages looked up are read from disk."""
 
     @classmethod
     def from_export(cls, title: str) -> Self:      
@@ -50,12 +236,12 @@ class _EntryBase:
         wikitext = fetched.wikitext
 
         if fetched.wikitext == '':
-            status = f'No content for {title} in exported page'
+            status = Status.NO_EXPORT_CONTENT
         elif fetched.ns != cls.NS:
-            status = f'No proper wiki namespace found for {title}'
+            status = Status.BAD_NS
             wikitext = ''
         else:
-            status = 'OK'
+            status = Status.OK
         return cls(title, wikitext, status,'from export')
 
     @classmethod
@@ -63,7 +249,7 @@ class _EntryBase:
         """
         Create a class instance by fetching the *wikitext* from local dictionary.
 
-        During the session, only one dictionary is loaded. The dictionary is loaded from the pickle file `'wikidict_{*cls.NS*}.pkl'`, which is located in `dict_path`.  
+        During the session, only one dictionary is opened. The dictionary is memory-mapped from the files built for the dictionary file `'wikidict_{*cls.NS*}.msgpack.gz'` (or `'wikidict_{*cls.NS*}.pkl'`, or its compressed version `'wikidict_{*cls.NS*}.pkl.zst'`), which is located in `dict_path`.  
 
         Args:
             title: The title of the Wiktionary page to fetch.
@@ -72,45 +258,73 @@ class _EntryBase:
         Returns:
             An EntryBase or a subclass instance
         """
+        return cls._from_wikidict(title, cls.get_wikidict(dict_path))
+
+    @classmethod
+    def from_dump_many(cls, titles: Iterable[str], dict_path: Optional[str] = None, workers: Optional[int] = None) -> List[Self]:
+        """
+        Create class instances for several titles by fetching the *wikitext* from local dictionary.
+
+        The dictionary is opened once for all titles. If `workers` is given, the instances are created and parsed in a pool of worker processes, each one mapping the dictionary files again instead of receiving the dictionary.
+
+        Args:
+            titles: The titles of the Wiktionary pages to fetch.
+            dict_path: Path to the folder containing the dictionary. If `None`, the folder indicated in `Settings` will be used.
+            workers: Number of worker processes. If `None`, the instances are created in the current process.
+
+        Returns:
+            A list of EntryBase or subclass instances, in the same order as `titles`.
+        """
         wikidict = cls.get_wikidict(dict_path)
-        wikitext = wikidict.get(title, '')
-        status = 'OK' if wikitext != '' else f'No content for {title} in dump file'
+        if workers is None:
+            return [cls._from_wikidict(title, wikidict) for title in titles]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cls, wikidict)) as ex:
+            return list(ex.map(_build_and_parse, [(cls, title) for title in titles], chunksize=64))
+
+    @classmethod
+    def _from_wikidict(cls, title: str, wikidict: Mapping[bytes, bytes]) -> Self:
+        wikitext = wikidict.get(title.encode('utf-8'), b'').decode('utf-8')
+        status = Status.OK if wikitext != '' else Status.NO_DUMP_CONTENT
         return cls(title, wikitext, status, 'from dump')
 
     
     @classmethod
-    def get_wikidict(cls, dict_path: Optional[str] = None) -> Dict[str, str]:
+    def get_wikidict(cls, dict_path: Optional[str] = None) -> Mapping[bytes, bytes]:
         """
-        Load the dictionary from the pickle file. 
+        Open the memory-mapped dictionary of the dictionary file. 
 
-        If the dictionary is already loaded, return the dictionary from memory. Per session, only one dictionary is loaded. The dictionary is loaded from the pickle file 'wikidict_{*cls.NS*}.pkl' in `dict_path` or in the folder indicated in `Settings` if `dict_path` is not provided.
+        If the dictionary is already opened, return it, unless its files were rebuilt since (e.g. by [`WikiDump.create_dict_by_ns`][de_wiktio.fetch.WikiDump.create_dict_by_ns]), in which case it is opened again. Per session, only one dictionary is opened. The dictionary is built for the dictionary file 'wikidict_{*cls.NS*}' in `dict_path` or in the folder indicated in `Settings` if `dict_path` is not provided (see [`WikiDumpMmap`][de_wiktio.fetch.WikiDumpMmap]).
 
         Args:
             dict_path: Path to the folder containing the dictionary. If `None`, the folder indicated in `Settings` will be used.
 
         Returns:
-            A dictionary with page titles as keys and their corresponding *wikitext* as values.
+            A read-only mapping with the *utf-8* encoded page titles as keys and their corresponding encoded *wikitext* as values.
         """
-        # if the dictionary is already loaded, return it
-        if cls.WIKIDICT is not None:
-            return cls.WIKIDICT
+        # if the dictionary is already opened, and its files were not rebuilt since, return it
+        wikidict = _WIKIDICTS.get(cls.NS)
+        if wikidict is not None:
+            if not wikidict.stale:
+                return wikidict
+            dict_path = dict_path or wikidict.base.parent
+            # drop the pages looked up in the replaced files
+            _parse_cached.cache_clear()
+            _flexion_wikitext.cache_clear()
         
-        # otherwise, load the dictionary
-        if dict_path is None:
-            cls.WIKIDICT = WikiDump.load_wikidict_by_ns(ns=cls.NS)
-        else:
-            _file = Path(dict_path) / f'wikidict_{cls.NS}.pkl'
-            cls.WIKIDICT = WikiDump.load_wikidict_by_ns(file=_file, ns=cls.NS)
+        # otherwise, open the dictionary
+        _file = WikiDump.wikidict_file(ns=cls.NS, dict_path=dict_path)
+        _WIKIDICTS[cls.NS] = WikiDumpMmap.load_by_ns(file=_file, ns=cls.NS)
 
-        return cls.WIKIDICT
+        return _WIKIDICTS[cls.NS]
 
-    def __init__(self, title: str, wikitext:str, status:str='OK', extracted_from:str =None) -> None:
+    def __init__(self, title: str, wikitext:str, status:Status=Status.OK, extracted_from:str =None) -> None:
         """The EntryBase constructor.
 
         Args:
             title: The wiki page title
             wikitext: The *wikitext* of the page
-            status: The status.  
+            status: The status, a [`Status`][de_wiktio.entry.Status] code. A message string, as in previous versions, is converted with [`Status.from_message`][de_wiktio.entry.Status.from_message] (deprecated).
             extracted_from: The source of the extraction.
 
                 - The possible values are: 'from dump', 'from export' or `None`.
@@ -122,10 +336,17 @@ class _EntryBase:
         self.text: str = wikitext
         """The *wikitext* of the page."""
 
-        self.status: str = status
-        """The status of the parsing and extraction. 
+        if isinstance(status, str):
+            # called through the constructor of a subclass
+            warnings.warn('Passing the status as a message string is deprecated. Please pass a Status code, e.g. Status.OK',
+                          DeprecationWarning, stacklevel=3)
+            status = Status.from_message(status)
+
+        self.status: Status = status
+        """The status of the parsing and extraction, as a [`Status`][de_wiktio.entry.Status] code. 
         
-        Some values are: 'OK', 'No content for {title} in exported page' or 'No proper wiki namespace found for {title}'
+        Some values are: `Status.OK`, `Status.NO_EXPORT_CONTENT` or `Status.BAD_NS`. See `status_message` for the corresponding message.
+        In previous versions, `status` was the message string itself (`'OK'` on success). It now prints as the name of the code, e.g. `OK`, but still compares equal to its message (see [`Status`][de_wiktio.entry.Status]).
         """
 
         self.extracted_from: str = extracted_from
@@ -133,9 +354,18 @@ class _EntryBase:
         
         The possible values are: 'from dump', 'from export' or `None`. A `None` value indicates that the instance was created directly from the constructor passing the *wikitext* and title of the page."""
 
-        if self.status != 'OK':
-            print(f'Wiki search for "{self.title}" failed: {self.status}')
-            return
+        self._parsed = _MISSING
+
+        if status:
+            self._on_fail()
+
+    def _on_fail(self) -> None:
+        """Report a failed search, called by the constructor only if the status is not `Status.OK`."""
+        print(f'Wiki search for "{self.title}" failed: {self.status_message()}')
+
+    def status_message(self) -> str:
+        """The human-readable message of the status, e.g. 'No content for {title} in dump file'."""
+        return self.status.message(self.title)
 
  
     @property
@@ -143,9 +373,13 @@ class _EntryBase:
         """The parsed *wikitext* of the page.
         
         The *wikitext* is parsed using the `mwparserfromhell` library.
+        For entries created with `from_dump`, the parsed *wikitext* is shared between entries with the same *wikitext* (up to 4096 pages are kept), so it must not be modified in place.
         """
-        if not hasattr(self, '_parsed'):
-            self._parsed = mwparserfromhell.parse(self.text)
+        if self._parsed is _MISSING:
+            if self.extracted_from == 'from dump':
+                self._parsed = _parse_cached(self.text)
+            else:
+                self._parsed = _parse(self.text)
         return self._parsed
 
     
@@ -159,17 +393,17 @@ class _EntryBase:
         Raises:
             Exception: If more than one German section is found.
         """
-        sections = self.parsed.get_sections(levels=[2], matches=r"\|Deutsch")
+        sections = self.parsed.get_sections(levels=[2], matches=lambda title: _DE_MATCH.search(str(title)))
 
         if len(sections) == 1:
             return sections[0]
         
         if len(sections) > 1:
-            self.status = f'More than one German section found for {self.title}'
+            self.status = Status.MULTI_DE
             return None
         
         if len(sections) == 0:
-            self.status = f'No German section found for {self.title}'
+            self.status = Status.NO_DE
             return None
          
 
@@ -190,16 +424,31 @@ class _EntryBase:
                 print(' ' * 8 * (heading.level - level), heading.level, heading.title)
 
 
+def _init_worker(cls: type[_EntryBase], wikidict: WikiDumpMmap) -> None:
+    """Register the dictionary of `cls` in a worker process of `from_dump_many`."""
+    _WIKIDICTS[cls.NS] = wikidict
+
+
+def _build_and_parse(args: tuple[type[_EntryBase], str]) -> _EntryBase:
+    """Create and parse the entry for a title in a worker process of `from_dump_many`."""
+    cls, title = args
+    entry = cls._from_wikidict(title, cls.get_wikidict())
+    entry.parsed
+    return entry
+
+
 class Entry(_EntryBase):
     """Entry class for parsing *wikitext* from main content pages (ns = `0`) of the German Wiktionary.   
      
     This class deals with the German section of the page, i.e. the German-to-German dictionary. Therefore, it does not parse multilingual entries, such as English-to-German, French-to-German, etc...
     """
 
+    __slots__ = ('_wordforms',)
+
     NS: str = '0'
     """Class attribute: The namespace of the entry, set to `'0'`."""
 
-    def __init__(self, title: str, wikitext:str, status:str='OK', extracted_from:str =None) -> None:
+    def __init__(self, title: str, wikitext:str, status:Status=Status.OK, extracted_from:str =None) -> None:
         """
         The Entry class constructor.
 
@@ -210,6 +459,7 @@ class Entry(_EntryBase):
             extracted_from: The source of the extraction.
         """
         super().__init__(title, wikitext, status, extracted_from)
+        self._wordforms = _MISSING
         self.german: Wikicode = self._get_section_de()
         """The German section of the page."""
 
@@ -217,16 +467,16 @@ class Entry(_EntryBase):
     @property
     def wordforms(self) -> List[WordForm]:
         """List of German word forms."""
-        if not hasattr(self, '_wordforms'):
-            if self.status != 'OK':
+        if self._wordforms is _MISSING:
+            if self.status != Status.OK:
                 return []
             
             self._wordforms = self.german.get_sections(levels=[3],
-                                              matches="Wortart",
+                                              matches=lambda title: _WORTART_MATCH.search(str(title)),
                                               flat=True)
             
             if len(self._wordforms) == 0:
-                self.status = f'No German word forms for {self.title}'
+                self.status = Status.NO_WORDFORMS
 
             self._wordforms = [WordForm(form, entry=self) for form in self._wordforms]
         
@@ -241,10 +491,12 @@ class EntryFlexion(_EntryBase):
     This class deals with the German section of the page, i.e. the German-to-German dictionary. Therefore, it does not parse multilingual entries, such as English-to-German, French-to-German, etc...
     """
      
+    __slots__ = ('_pos', '_flexion_tpls')
+
     NS = '108'
     """Class attribute: The namespace of the entry, set to `'108'`."""
 
-    def __init__(self, title: str, wikitext: str, status: str = 'OK', extracted_from: Optional[str] = None) -> None:
+    def __init__(self, title: str, wikitext: str, status: Status = Status.OK, extracted_from: Optional[str] = None) -> None:
         """
         The EntryFlexion class constructor.
 
@@ -256,6 +508,7 @@ class EntryFlexion(_EntryBase):
 
         """
         super().__init__(title, wikitext, status, extracted_from)
+        self._pos = self._flexion_tpls = _MISSING
         self.german: Wikicode = self._get_section_de()
         """The German section of the page."""
 
@@ -265,28 +518,56 @@ class EntryFlexion(_EntryBase):
 
         The POS are extracted from the name of the flexion templates in the body.
         The possible values are "Adjektiv", "Verb", "Adverb", "Gerundivum", or "Numerale".
+        For the common layout of a single flexion template, the POS is found directly in the *wikitext*, without going through the parsed templates.
         """
-        if not hasattr(self, '_pos'):
-            if self.status != 'OK':
+        if self._pos is _MISSING:
+            if self.status != Status.OK:
                 return []
             
-            pattern = r"(Adjektiv|Verb|Adverb|Gerundivum|Numerale)"
-            compiled = re.compile(pattern)
+            pos = self._pos_from_text()
+            if pos is not None:
+                self._pos = pos
+                return self._pos
+
             self._pos = []
 
             for template in self.flexion_tpls:
-                match = compiled.search(str(template.name))
+                match = _POS_RE.search(_tpl_name(template))
                 if match:
                     self._pos.append(match.group(1))
 
             if not self._pos:
-                self.status = f'No POS found for {self.title}'
+                self.status = Status.NO_POS
             
             if len(self._pos) > 1:
-                self.status = f'Multiple POS found for {self.title}'
+                self.status = Status.MULTI_POS
 
         return self._pos
 
+    def _pos_from_text(self) -> Optional[List[str]]:
+        """POS of a German section made of a single flexion template, scanning the *wikitext*.
+
+        Returns `None` if the section does not have this layout, so that the templates must be parsed.
+        """
+        headings = _DE_HEADING_RE.findall(self.text)
+        if len(headings) != 1:
+            return None
+
+        start = self.text.index(headings[0]) + len(headings[0])
+        end = _HEADING_RE.search(self.text, start)
+        if end is not None:
+            if end.group(1) != '==':
+                return None
+            body = self.text[start:end.start()]
+        else:
+            body = self.text[start:]
+
+        # template arguments ({{{...}}}) are not templates, leave them to the parser
+        if body.count('{{') != 1 or '{{{' in body or '<' in body:
+            return None
+
+        return [match.group(1) for match in _FLEX_POS_RE.finditer(body)] or None
+
     def inflections(self) -> List[Dict[str, str]]:
         """Retrieve a list of dictionaries from the inflection templates.
 
@@ -301,22 +582,98 @@ class EntryFlexion(_EntryBase):
 
         Templates are extracted from the body of the page.
         """
-        if not hasattr(self, '_flexion_tpls'):
-            if self.status != 'OK':
+        if self._flexion_tpls is _MISSING:
+            if self.status != Status.OK:
                     return []
             body = self.german.get_sections(include_headings=False)
-            self._flexion_tpls = []
-            for node in body:
-                self._flexion_tpls += node.filter_templates()
+            self._flexion_tpls = list(itertools.chain.from_iterable(
+                section.filter_templates() for section in body))
             
             if self._flexion_tpls == []:
-                self.status = 'No German flexion templates'
+                self.status = Status.NO_FLEX
             elif len(self._flexion_tpls) > 1:
-                self.status = 'Multiple German flexion templates'
+                self.status = Status.MULTI_FLEX
         
         return self._flexion_tpls
 
 
+class EntryBatch:
+    """Column-wise container of many pages from the dump.
+
+    Titles, *utf-8* encoded wikitexts and status codes are stored in parallel lists, one item per page, instead of one `Entry` object per page. The entry objects, with their parsed *wikitext*, are only built on demand with `view`, or when indexing the batch.
+
+    The status codes are `Status.OK` or `Status.NO_DUMP_CONTENT` (the title is not found in the dump).
+    """
+
+    def __init__(self, entry_cls: type[_EntryBase] = None, dict_path: Optional[str] = None) -> None:
+        """The EntryBatch constructor.
+
+        Args:
+            entry_cls: The class of the entries, which defines the wiki namespace of the pages, i.e. `Entry` or `EntryFlexion`. If `None`, `Entry` is used.
+            dict_path: Path to the folder containing the dictionary. If `None`, the folder indicated in `Settings` will be used.
+        """
+        self.entry_cls: type[_EntryBase] = entry_cls or Entry
+        """The class of the entries."""
+
+        self.titles: List[str] = []
+        """The titles of the pages."""
+
+        self.texts: List[bytes] = []
+        """The *utf-8* encoded *wikitext* of the pages."""
+
+        self.status: array = array('b')
+        """The status codes of the pages, one byte per page."""
+
+        self._wikidict = self.entry_cls.get_wikidict(dict_path)
+
+    def append_from_dump(self, title: str) -> None:
+        """Add a page from the dump, without creating an entry object.
+
+        Args:
+            title: The title of the Wiktionary page.
+        """
+        text = self._wikidict.get(title.encode('utf-8'), b'')
+        self.titles.append(title)
+        self.texts.append(text)
+        self.status.append(Status.OK if text else Status.NO_DUMP_CONTENT)
+
+    def extend_from_dump(self, titles: Iterable[str]) -> None:
+        """Add several pages from the dump, see `append_from_dump`.
+        
+        Args:
+            titles: The titles of the Wiktionary pages.
+        """
+        for title in titles:
+            self.append_from_dump(title)
+
+    def view(self, i: int) -> _EntryBase:
+        """Build the entry object of the `i`-th page.
+
+        Unlike the constructor of `entry_cls`, pages not found in the dump are not reported, see their `status` instead.
+
+        Args:
+            i: The index of the page in the batch.
+
+        Returns:
+            An instance of `entry_cls`.
+        """
+        entry = self.entry_cls(self.titles[i], self.texts[i].decode('utf-8'), Status.OK, 'from dump')
+        status = Status(self.status[i])
+        if status:
+            # set after the construction, so that the failure is not printed for each page
+            entry.status = status
+        return entry
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __getitem__(self, i: int | slice) -> _EntryBase | List[_EntryBase]:
+        """The entry object of the `i`-th page (see `view`), or a list of entry objects if `i` is a slice."""
+        if isinstance(i, slice):
+            return [self.view(j) for j in range(*i.indices(len(self)))]
+        return self.view(i)
+
+
 class WordForm:
     """A class representing a word form.
 
@@ -332,16 +689,33 @@ class WordForm:
         """
         self.wordform: Wikicode = wordform
         """A Wikicode object containing the word form."""
-        self.status: str = 'OK'
-        """The status of the word form."""
+        self.status: Status = Status.OK
+        """The status of the word form, as a [`Status`][de_wiktio.entry.Status] code."""
         self.entry: Entry = entry
         """The `Entry` object to which the word form belongs."""
 
+        self._pos = self._wortart_tpls = self._übersichten_tpls = _MISSING
+        self._content_index = self.__flexionseite = self._text = _MISSING
+
     @property
     def heading(self) -> Heading:
         """The heading of the word form."""
         return self.wordform.filter_headings()[0]
 
+    @property
+    def text(self) -> str:
+        """The *wikitext* of the word form.
+
+        Rendered once from `wordform` on first access.
+        """
+        if self._text is _MISSING:
+            self._text = str(self.wordform)
+        return self._text
+
+    def status_message(self) -> str:
+        """The human-readable message of the status, e.g. 'No POS found for {heading title}'."""
+        return self.status.message(self.heading.title)
+
 
     @property
     def pos(self) -> List[str]:
@@ -349,12 +723,12 @@ class WordForm:
 
         The POS are extracted from the *Wortart* templates of the word form.
         """
-        if not hasattr(self, '_pos'):
+        if self._pos is _MISSING:
             self._pos = [str(tpl.get('1')) 
                          for tpl in self.wortart_tpls 
                          if tpl.get('1', default=None)]
             if not self._pos:
-                self.status = f'No POS found for {self.heading.title}'
+                self.status = Status.NO_POS
                 
         return self._pos
 
@@ -367,8 +741,8 @@ class WordForm:
             EntryFlexion object or None if the Flexion page is not found or if the word form is not a verb nor an adjective.
         """
 
-        if not hasattr(self, '__flexionseite'):
-            if self.status != 'OK':
+        if self.__flexionseite is _MISSING:
+            if self.status != Status.OK:
                 self.__flexionseite = None
                 return self.__flexionseite
 
@@ -377,10 +751,7 @@ class WordForm:
                 return self.__flexionseite
 
             title = f'Flexion:{self.entry.title}'
-            if self.entry.extracted_from == 'from export':
-                self.__flexionseite = EntryFlexion.from_export(title) 
-            else:
-                self.__flexionseite = EntryFlexion.from_dump(title)
+            self.__flexionseite = _resolve_flexionseite(self.entry.extracted_from == 'from export', title)
             
         return self.__flexionseite
 
@@ -432,9 +803,16 @@ class WordForm:
         Returns:
             The extracted content, either as plain text or raw *wikitext*.
         """
-        text = str(self.wordform)
-        pattern = r'\n\n\{\{' + name + r'\}\}\n(.+?)\n\n'
-        search = re.search(pattern, text, re.DOTALL)
+        nodes = self._content_nodes(name)
+
+        if nodes is not None:
+            content = Wikicode(SmartList(nodes))
+            if strip_code:
+                return content.strip_code(**(strip_kw or {}))
+            return str(content)
+
+        # fall back to searching the wikitext
+        search = _content_re(name).search(self.text)
         
         if search is None:
             return  
@@ -443,12 +821,101 @@ class WordForm:
         
         if strip_code:
             if strip_kw is not None:
-                content = mwparserfromhell.parse(content).strip_code(**strip_kw)
+                content = _parse(content).strip_code(**strip_kw)
             else:
-                content = mwparserfromhell.parse(content).strip_code()
+                content = _parse(content).strip_code()
             
         return content
 
+    def extract_many(self, names: Iterable[str], strip_code: bool = True, strip_kw: Optional[Dict[str, str]] = None) -> Dict[str, Optional[str]]:
+        """Extract several types of other content at once, e.g. `['Bedeutungen', 'Beispiele', 'Synonyme']`.
+
+        Works as [`other_content_extract`][de_wiktio.entry.WordForm.other_content_extract] for each name, but the paragraphs that cannot be found by walking the nodes of the word form are searched in the *wikitext* in a single pass for all names.
+
+        Args:
+            names: The names of the templates to extract content from.
+            strip_code: Whether to strip *wikitext* code from the extracted content and return plain text.
+            strip_kw: A dictionary of keyword arguments to pass to `strip_code` method of [`mwparserfromhell.nodes.Wikicode`][mwparserfromhell.wikicode.Wikicode.strip_code] objects.
+
+        Returns:
+            A dictionary with the names as keys and the extracted content as values, or `None` if the content is not found.
+        """
+        contents = {}
+        missing = []
+        for name in names:
+            nodes = self._content_nodes(name)
+            if nodes is None:
+                missing.append(name)
+            else:
+                contents[name] = Wikicode(SmartList(nodes))
+
+        if missing:
+            found = {}
+            for match in _contents_re(tuple(missing)).finditer(self.text):
+                found.setdefault(match.group(1), match.group(2))
+            for name in missing:
+                contents[name] = found.get(name)
+
+        for name, content in contents.items():
+            if content is None:
+                continue
+            if strip_code:
+                if isinstance(content, str):
+                    content = _parse(content)
+                contents[name] = content.strip_code(**(strip_kw or {}))
+            else:
+                contents[name] = str(content)
+        return contents
+
+    def _index_contents(self) -> Dict[str, int]:
+        """Index of the nodes of templates without parameters that start a paragraph, by template name."""
+        index = {}
+        nodes = self.wordform.nodes
+        for i, node in enumerate(nodes[1:], start=1):
+            if (isinstance(node, Template) and not node.params
+                    and isinstance(nodes[i - 1], Text) and nodes[i - 1].value.endswith('\n\n')):
+                index.setdefault(str(node.name), i)
+        return index
+
+    def _content_nodes(self, name: str) -> Optional[List[Node]]:
+        """Nodes of the paragraph introduced by the template `name`, without the template line.
+
+        Returns `None` if the paragraph cannot be delimited by walking the nodes of the word form.
+        """
+        if self._content_index is _MISSING:
+            self._content_index = self._index_contents()
+
+        i = self._content_index.get(name)
+        if i is None:
+            return None
+
+        collected = []
+        length = 0
+        last = ''
+        for node in self.wordform.nodes[i + 1:]:
+            if not isinstance(node, Text):
+                value = str(node)
+                if not collected or '\n\n' in value or (last == '\n' and value.startswith('\n')):
+                    return None
+                collected.append(node)
+            else:
+                value = node.value
+                if not collected:
+                    if not value.startswith('\n'):
+                        return None
+                    value = value[1:]
+                elif last == '\n' and value.startswith('\n'):
+                    return None
+                # the paragraph ends at the first blank line, after at least one character
+                end = value.find('\n\n', max(0, 1 - length))
+                if end != -1:
+                    if end > 0:
+                        collected.append(Text(value[:end]))
+                    return collected
+                collected.append(Text(value))
+            length += len(value)
+            last = value[-1:] or last
+        return None
 
     @property
     def wortart_tpls(self) -> List[Template]:
@@ -456,10 +923,10 @@ class WordForm:
         
         Note: In principle, one would expect only one *Wortart* template per word form, but in practice, there can be more than one.        
         """
-        if not hasattr(self, '_wortart_tpls'):
-            self._wortart_tpls = self.wordform.filter_templates(matches='Wortart')
+        if self._wortart_tpls is _MISSING:
+            self._wortart_tpls = self._tpl_index.get('wortart', [])
             if len(self._wortart_tpls) == 0:
-                self.status = f'No Wortart template found for {self.heading.title}'
+                self.status = Status.NO_WORTART
                 self._wortart_tpls = []
         
         return self._wortart_tpls
@@ -475,11 +942,63 @@ class WordForm:
     
         Note: Most word forms have either none or only one Übersicht template, but there are cases where they have more than one, such as for 'Mars' and 'Partikel'.
         """
-        if not hasattr(self, '_übersichten_tpls'):
-            self._übersichten_tpls = self.wordform.filter_templates(matches='Übersicht')
+        if self._übersichten_tpls is _MISSING:
+            self._übersichten_tpls = self._tpl_index.get('übersicht', [])
         return self._übersichten_tpls
+
+    @functools.cached_property
+    def _tpl_index(self) -> Dict[str, List[Template]]:
+        """Templates of the word form grouped by category (see `_classify`), collected in a single traversal."""
+        index = {}
+        for template in self.wordform.filter_templates():
+            bucket = _classify(_tpl_name(template))
+            if bucket is not None:
+                index.setdefault(bucket, []).append(template)
+        return index
  
     
+class _FlexionNotFound(Exception):
+    """Raised by `_flexion_wikitext` for a failed lookup, so that it is not cached."""
+
+    def __init__(self, entry: EntryFlexion) -> None:
+        super().__init__(entry.title)
+        self.entry = entry
+
+
+@functools.lru_cache(maxsize=2048)
+def _flexion_wikitext(from_export: bool, title: str) -> str:
+    """The *wikitext* of the Flexion page `title`, shared by all word forms referring to it.
+
+    Args:
+        from_export: If `True`, the page is fetched online, otherwise it is taken from the dump.
+        title: The title of the Flexion page.
+
+    Raises:
+        _FlexionNotFound: If the page is not found, with the failed entry.
+    """
+    entry = EntryFlexion.from_export(title) if from_export else EntryFlexion.from_dump(title)
+    if entry.status != Status.OK:
+        raise _FlexionNotFound(entry)
+    return entry.text
+
+
+def _resolve_flexionseite(from_export: bool, title: str) -> EntryFlexion:
+    """A new EntryFlexion object of the Flexion page `title`, whose *wikitext* is looked up once for all word forms (see `_flexion_wikitext`).
+
+    Args:
+        from_export: If `True`, the page is fetched online, otherwise it is taken from the dump.
+        title: The title of the Flexion page.
+    """
+    if not from_export:
+        # reopens the dictionary, clearing the cache, if its files were rebuilt
+        EntryFlexion.get_wikidict()
+    try:
+        wikitext = _flexion_wikitext(from_export, title)
+    except _FlexionNotFound as error:
+        return error.entry
+    return EntryFlexion(title, wikitext, Status.OK, 'from export' if from_export else 'from dump')
+
+
 class Tools:
     """Collection of utility functions."""
 
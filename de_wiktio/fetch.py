@@ -3,12 +3,157 @@
 This module provides methods to fetch and parse XML files from the Wiktionary domain.
 """ 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import gzip
+import hashlib
+import io
 import pickle
+import bisect
+import mmap
+import os
+import re
+import sys
 import lxml.etree as ET
-from typing import List, Dict,Tuple
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, lru_cache, partial
+from collections.abc import Iterator, Mapping
+from typing import List, Dict, Optional, Sequence
 from pathlib import Path
 from de_wiktio.settings import Settings
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_BUFFER_SIZE = 1 << 20
+"""Buffer size of the dictionary files, so that they are written and read in large chunks."""
+
+_DICT_SUFFIXES = ('.pkl.zst', '.msgpack.gz', '.msgpack', '.pkl')
+"""Suffixes of the dictionary files, in every format they can be saved in."""
+
+_GZIP_LEVEL = 3
+"""Compression level of the gzipped *msgpack* files, a good trade-off between file size and writing time."""
+
+_DEDUP_MAX_LEN = 512
+"""Maximum length of the wikitexts shared between pages when building a dictionary. Short wikitexts, like redirects, are the ones that repeat."""
+
+_PARALLEL_MIN_SIZE = 64 << 20
+"""Minimum size in bytes of the XML file to build a dictionary in parallel. Smaller files are parsed faster than the worker processes start."""
+
+_SESSION = requests.Session()
+"""HTTP session shared by all requests to Wiktionary, so that connections are kept alive and reused."""
+_SESSION.headers.update({
+    "Accept-Encoding": "gzip",
+    "User-Agent": "de_wiktio (https://github.com/lennon-c/de_wiktio)",
+})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.3)))
+
+_TIMEOUT = 30
+"""Timeout in seconds of the requests to Wiktionary."""
+
+_API_URL = "https://de.wiktionary.org/w/api.php"
+_API_MAX_TITLES = 50
+"""Maximum number of titles per request to the Action API."""
+
+
+_MW = 'http://www.mediawiki.org/xml/export-0.11/'
+"""XML namespace of the MediaWiki export format. The namespace of each XML file is read from its root element, this one is only the default."""
+
+
+def _clark(name: str, uri: Optional[str] = _MW) -> str:
+    """Tag of the element `name` in Clark notation (`{uri}name`) for the XML namespace `uri`."""
+    return f'{{{uri}}}{name}' if uri else name
+
+
+def _sniff_uri(file: Path) -> Optional[str]:
+    """XML namespace of the root element of the XML file `file`, read without parsing the rest of the file."""
+    with open(file, 'rb') as f:
+        _, root = next(ET.iterparse(f, events=('start',)))
+        return ET.QName(root).namespace
+
+
+class _DictBuilder:
+    """Parser target building the dictionary of title-wikitext pairs of the pages of a wiki namespace.
+
+    The parser calls `start`, `data` and `end` for each element, so only the text of the `ns`, `title` and `text` elements is collected and no element is ever built.
+    Titles are interned and short wikitexts, like redirects, are shared between pages.
+    """
+    __slots__ = ('ns', 'dic', '_seen', '_tags', '_buf', '_ns', '_title', '_text', '_has_text')
+
+    def __init__(self, ns: Optional[str] = None, uri: Optional[str] = _MW) -> None:
+        self.ns = ns
+        self.dic: Dict[str, str] = dict()
+        self._seen: Dict[str, str] = dict()
+        self._tags = {_clark(name, uri): name for name in ('page', 'ns', 'title', 'text')}
+        self._buf: Optional[List[str]] = None
+        self._ns = self._title = self._text = None
+        self._has_text = False
+
+    def start(self, tag: str, attrib) -> None:
+        name = self._tags.get(tag)
+        if name in ('ns', 'title'):
+            self._buf = []
+        elif name == 'text' and (self.ns is None or self._ns == self.ns):
+            # the ns element comes before the revisions, so the wikitext of the pages of other namespaces is never collected
+            self._buf = []
+
+    def data(self, data: str) -> None:
+        if self._buf is not None:
+            self._buf.append(data)
+
+    def end(self, tag: str) -> None:
+        name = self._tags.get(tag)
+        if name is None:
+            return
+        if name == 'page':
+            if self.ns is None or self._ns == self.ns:
+                wikitext = self._text
+                if wikitext is not None and len(wikitext) < _DEDUP_MAX_LEN:
+                    wikitext = self._seen.setdefault(wikitext, wikitext)
+                self.dic[sys.intern(self._title)] = wikitext
+            self._ns = self._title = self._text = None
+            self._has_text = False
+            return
+
+        if self._buf is None:
+            return
+        text = ''.join(self._buf)
+        self._buf = None
+        if name == 'ns':
+            self._ns = text
+        elif name == 'title':
+            self._title = text
+        elif not self._has_text:
+            # only the first revision of the page, even if its text element is empty (no wikitext)
+            self._text = text or None
+            self._has_text = True
+
+    def close(self) -> Dict[str, str]:
+        return self.dic
+
+
+def _parse_chunk(file: Path, start: int, end: int, ns: Optional[str], uri: Optional[str]) -> Dict[str, str]:
+    """Build the dictionary of the pages between the byte offsets `start` and `end` of the XML file, which are wrapped in a root element of the XML namespace `uri`."""
+    parser = ET.XMLParser(target=_DictBuilder(ns, uri), huge_tree=True, collect_ids=False)
+    try:
+        parser.feed(f'<mediawiki xmlns="{uri}">'.encode() if uri else b'<mediawiki>')
+        with open(file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for i in range(start, end, _BUFFER_SIZE):
+                parser.feed(mm[i:min(i + _BUFFER_SIZE, end)])
+        parser.feed(b'</mediawiki>')
+        return parser.close()
+    except ET.XMLSyntaxError as e:
+        # lxml errors cannot be pickled back to the main process
+        raise ValueError(f"Invalid XML in {file} between bytes {start} and {end}: {e}. Please check that the XML file is complete") from None
+
 
 # %% WikiDump
 class WikiDump:
@@ -34,47 +179,50 @@ class WikiDump:
             raise FileNotFoundError(f"File not found: {xml_path}. Please provide a valid path or set a valid XML_FILE in Settings") 
         
         self.xml_path= Path(xml_path)
+        self._uri = _sniff_uri(self.xml_path)
+        self._tag_page = _clark('page', self._uri)
 
         # Instance attributes docstring 
         self.xml_path: Path
         "Path to the XML dump file to be processed."
    
 
-    @property
+    @cached_property
     def tree(self) -> ET._ElementTree:
         """The lxml tree object from the XML file.
         
         Lazy evaluation. This is a time consuming operation, so it is only computed when needed."""
-        if not hasattr(self, '_tree'):
-            self._tree = ET.parse(self.xml_path)
-        return self._tree
+        return ET.parse(str(self.xml_path), ET.XMLParser(huge_tree=True, collect_ids=False))
 
-    @property
+    @cached_property
     def root(self) -> ET.Element:
         """The root element of the tree.
 
         Lazy evaluation. This is a time consuming operation, so it is only computed when needed."""
-        if not hasattr(self, '_root'):
-            self._root  = self.tree.getroot()
-        return self._root
+        return self.tree.getroot()
 
-    @property
+    @cached_property
     def namespaces(self) -> Dict[str, str]:
         """Dictionary of XML namespaces of the root element."""
-        if not hasattr(self, '_namespaces'):
-            self._namespaces = self._root.nsmap
-        return self._namespaces
+        return self.root.nsmap
 
-    @property
+    @cached_property
     def pages(self) -> List[ET.Element]:
         """List of all page elements from the XML file.
         
         This includes all pages from all wiki namespaces.
         Lazy evaluation. This is a time consuming operation, so it is only computed when needed.
         """
-        if not hasattr(self, '_pages'):
-            self._pages = self.root.findall('page', namespaces=self.namespaces)
-        return self._pages
+        return self.root.findall(self._tag_page)
+
+    def iter_pages(self) -> Iterator[ET.Element]:
+        """
+        Iterate over all page elements from the XML file, without building the list of `pages`.
+
+        Returns:
+            An iterator of page elements, from all wiki namespaces.
+        """
+        return self.root.iterchildren(self._tag_page)
     
     def pages_by_ns(self, ns: str) -> List[ET.Element]:
         """
@@ -86,24 +234,31 @@ class WikiDump:
         Returns:
             A list of page elements.
         """
-        elements = list()
-        for p in self.pages:
-            element = p.find('ns', namespaces=self.namespaces)
-            if element.text == ns: 
-                elements.append(p)
-        return elements
-
-    def create_dict_by_ns(self, ns: str, dict_path: str = None) -> Dict[str, str]:
+        tag_ns = _clark('ns', self._uri)
+        return [p for p in self.iter_pages() if p.findtext(tag_ns) == ns]
+
+    def create_dict_by_ns(self, ns: str, dict_path: str = None, compress: bool = False, workers: Optional[int] = None) -> Dict[str, str]:
         """
-        Create a dictionary with titles as keys and the corresponding *wikitext* as values and saves it to a pickle file.
+        Create a dictionary with titles as keys and the corresponding *wikitext* as values and saves it to a file.
+
+        The dictionary is saved with *msgpack*, compressed with *gzip*, if the optional `msgpack` package is installed, which is smaller and much faster to load, and with pickle otherwise.
 
         Args:
             ns: The Wiki namespace identifier to filter pages (e.g., `'0'` for content pages, `'108'` for Flexion pages)
-            dict_path: The path where the dictionary should be saved. If not provided, the dictionary will be saved as 'wikidict_{ns}.pkl' in the folder indicated in Settings.
+            dict_path: The path where the dictionary should be saved. If not provided, the dictionary will be saved as 'wikidict_{ns}.msgpack.gz' (or 'wikidict_{ns}.pkl' without `msgpack`) in the folder indicated in Settings.
+            compress: If `True`, the dictionary is pickled, compressed with *zstd* and saved as 'wikidict_{ns}.pkl.zst'. Requires the optional `zstandard` package.
+            workers: If given, the XML file is split at page boundaries and the chunks are parsed in parallel by this number of processes. Files smaller than 64 MiB are always parsed serially.
 
         Returns:
             A dictionary with page titles as keys and their corresponding *wikitext* as values.
+
+        Raises:
+            ImportError: If `compress` is `True` and `zstandard` is not installed.
+            ValueError: If the XML file is parsed in parallel (see `workers`) and is invalid or truncated. When parsed serially, `lxml.etree.XMLSyntaxError` is raised instead.
         """
+        if compress and zstandard is None:
+            raise ImportError("Compression requires the 'zstandard' package. Please install it or set compress=False")
+
         if dict_path is None:
             dict_path = WikiDump.settings.get('DICT_PATH')
             if dict_path is None:
@@ -114,27 +269,72 @@ class WikiDump:
         if not dict_path.exists():
             raise FileNotFoundError(f"Folder not found: {dict_path}. Please provide a valid path or set a valid DICT_PATH in Settings")
 
-        pages = self.pages_by_ns(ns)
-        dic = dict()
-        for p in pages:
-            title = p.find('title', namespaces=self.namespaces)
-            wikitext = p.find('revision/text', namespaces=self.namespaces)
-            dic[title.text] = wikitext.text
+        if workers and workers > 1 and self.xml_path.stat().st_size >= _PARALLEL_MIN_SIZE:
+            dic = self._create_dict_parallel(ns, workers)
+        else:
+            parser = ET.XMLParser(target=_DictBuilder(ns, self._uri), huge_tree=True, collect_ids=False)
+            dic = ET.parse(str(self.xml_path), parser)
      
-        dict_file = dict_path / f'wikidict_{ns}.pkl'
-        
-        with open(dict_file, 'wb') as f:
-            pickle.dump(dic, f)
+        if compress:
+            dict_file = dict_path / f'wikidict_{ns}.pkl.zst'
+            cctx = zstandard.ZstdCompressor(level=10, threads=-1)
+            with open(dict_file, 'wb', buffering=_BUFFER_SIZE) as f, cctx.stream_writer(f) as writer:
+                pickle.dump(dic, writer, protocol=5)
+        elif msgpack is not None:
+            dict_file = dict_path / f'wikidict_{ns}.msgpack.gz'
+            with open(dict_file, 'wb', buffering=_BUFFER_SIZE) as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=_GZIP_LEVEL) as f:
+                msgpack.pack(dic, f, use_bin_type=True)
+        else:
+            dict_file = dict_path / f'wikidict_{ns}.pkl'
+            with open(dict_file, 'wb', buffering=_BUFFER_SIZE) as f:
+                pickle.dump(dic, f, protocol=5)
+
+        WikiDumpMmap.build(dict_file, dic)
         return dic
 
     
+    def _create_dict_parallel(self, ns: str, workers: int) -> Dict[str, str]:
+        """Build the dictionary of the pages of `ns` by parsing chunks of the XML file in a process pool, see `create_dict_by_ns`."""
+        # chunk boundaries: the first page tag after each of a few equally spaced offsets
+        with open(self.xml_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first, end = mm.find(b'<page>'), mm.rfind(b'</mediawiki>')
+            if first == -1:
+                return dict()
+            if end == -1:
+                # truncated file: the chunks would parse without error if it is cut between two pages
+                raise ValueError(f"Invalid XML in {self.xml_path}: the closing </mediawiki> tag is missing. Please check that the XML file is complete")
+            n_chunks = workers * 4
+            bounds = [first]
+            for k in range(1, n_chunks):
+                pos = mm.find(b'<page>', max(first + (end - first) * k // n_chunks, bounds[-1] + 1), end)
+                if pos == -1:
+                    break
+                if pos > bounds[-1]:
+                    bounds.append(pos)
+            bounds.append(end)
+
+        dic = dict()
+        seen = dict()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            n = len(bounds) - 1
+            parts = executor.map(_parse_chunk, [self.xml_path] * n, bounds[:-1], bounds[1:], [ns] * n, [self._uri] * n)
+            # titles and short wikitexts are unpickled as new strings, so they are interned and shared again, as in `_DictBuilder`
+            for part in parts:
+                for title, wikitext in part.items():
+                    if wikitext is not None and len(wikitext) < _DEDUP_MAX_LEN:
+                        wikitext = seen.setdefault(wikitext, wikitext)
+                    dic[sys.intern(title)] = wikitext
+        return dic
+
     @classmethod
     def load_wikidict_by_ns(cls, file: str = None, ns: str = '0') -> Dict[str, str]:
         """
-        Load a dictionary with page titles as keys and their corresponding *wikitext* as values from a pickle file.
+        Load a dictionary with page titles as keys and their corresponding *wikitext* as values from a file.
+
+        The format is detected by the extension: *msgpack* files (suffix `.msgpack`), gzipped *msgpack* files (suffix `.msgpack.gz`), pickle files (suffix `.pkl`) and pickle files compressed with *zstd* (suffix `.zst`), which are decompressed on the fly.
 
         Args:
-            file: The path to the pickle file. If `None`, the file 'wikidict_{ns}.pkl' in the folder indicated in Settings will be used.	
+            file: The path to the dictionary file. If `None`, the file 'wikidict_{ns}' in the folder indicated in Settings will be used (see `wikidict_file`).	
             ns: The wikinamespace identifier to filter pages (e.g., `'0'` for content pages, `'108'` for Flexion pages). 
 
         Returns:
@@ -142,41 +342,249 @@ class WikiDump:
 
         Raises:
             FileNotFoundError: If the file does not exist.
+            ImportError: If the file is compressed and `zstandard` is not installed, or if it is a *msgpack* file and `msgpack` is not installed.
         """
-        if file is None:
+        file = cls._wikidict_file(file, ns)
+        if file.suffix == '.msgpack' or file.name.endswith('.msgpack.gz'):
+            if msgpack is None:
+                raise ImportError(f"The file {file} is a msgpack file. Please install the 'msgpack' package to load it.")
+            with open(file, 'rb', buffering=_BUFFER_SIZE) as f:
+                if file.suffix == '.gz':
+                    with gzip.GzipFile(fileobj=f, mode='rb') as gz:
+                        return msgpack.unpack(gz, raw=False, strict_map_key=False)
+                return msgpack.unpack(f, raw=False, strict_map_key=False)
+        if file.suffix == '.zst':
+            if zstandard is None:
+                raise ImportError(f"The file {file} is compressed with zstd. Please install the 'zstandard' package to load it.")
+            with open(file, 'rb') as f, zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                return pickle.Unpickler(io.BufferedReader(reader, buffer_size=_BUFFER_SIZE)).load()
+
+        with open(file, 'rb', buffering=_BUFFER_SIZE) as f:
+            dic = pickle.Unpickler(f).load()
+        return dic
+
+    @classmethod
+    def wikidict_file(cls, ns: str = '0', dict_path: str = None) -> Path:
+        """
+        Path to the file of the dictionary for the wiki namespace `ns`.
+
+        The files 'wikidict_{ns}.pkl.zst', 'wikidict_{ns}.msgpack.gz', 'wikidict_{ns}.msgpack' and 'wikidict_{ns}.pkl' are looked up, and the most recently modified one is returned, so a dictionary created again in another format replaces the older one.
+
+        Args:
+            ns: The wikinamespace identifier (e.g., `'0'` for content pages, `'108'` for Flexion pages).
+            dict_path: Path to the folder containing the dictionary. If `None`, the folder indicated in `Settings` will be used.
+
+        Returns:
+            The path to the dictionary file.
+
+        Raises:
+            FileNotFoundError: If no dictionary file exists for `ns`.
+        """
+        if dict_path is None:
             dict_path = cls.settings.get('DICT_PATH')
-            # print(type(dict_path))
             if dict_path is None:
                 raise ValueError("Path not provided. Please provide a valid path to the dictionary or set a valid DICT_PATH in Settings")
-            else:
-                file = Path(dict_path) / f'wikidict_{ns}.pkl'
-        else:
-            file = Path(file)
 
+        files = [Path(dict_path) / f'wikidict_{ns}{suffix}' for suffix in _DICT_SUFFIXES]
+        files = [file for file in files if file.exists()]
+        if not files:
+            raise FileNotFoundError(f"No dictionary file 'wikidict_{ns}' exists in {dict_path}. Please create it first using the 'create_dict_by_ns' method.")
+        return max(files, key=lambda file: file.stat().st_mtime_ns)
+
+    @classmethod
+    def _wikidict_file(cls, file: str = None, ns: str = '0') -> Path:
+        """Resolve the path to the file of the dictionary and check that it exists."""
+        if file is None:
+            return cls.wikidict_file(ns)
+
+        file = Path(file)
         if not file.exists():
             raise FileNotFoundError(f"The file {file} does not exist. Please create it first using the 'create_dict_by_ns' method.")
-        
-        with open(file, 'rb') as f:
-            dic = pickle.load(f)
-        return dic
-    
+        return file
+
+
+# %% WikiDumpMmap
+class WikiDumpMmap(Mapping):
+    """Read-only dictionary of title-wikitext pairs backed by memory-mapped files.
+
+    Instead of loading the whole dictionary into memory, the pairs are stored in two files next to the dictionary file:
+
+    - `wikidict_{ns}.keys`: the number of pages, the offsets of the titles and the packed *utf-8* titles, sorted.
+    - `wikidict_{ns}.data`: the concatenated *utf-8* wikitexts, followed by their offsets.
+
+    Keys and values are the *utf-8* encoded titles and wikitexts (`bytes`), as stored on disk, so a lookup bisects the sorted titles and copies only the requested *wikitext*, without decoding anything else. Only the pages actually looked up are read from disk.
+    The object only keeps the path to the files, so it can be pickled and sent to other processes, where the files are mapped again.
+    """
+
+    def __init__(self, file: str) -> None:
+        """
+        WikiDumpMmap object constructor.
+
+        Args:
+            file: Path to the file of the dictionary. The `.keys` and `.data` files are expected next to it.
+        """
+        self.base: Path = self._base(file)
+        "Path to the files without suffix, i.e. `'{dict_path}/wikidict_{ns}'`."
+
+        with open(self._path(self.base, '.keys'), 'rb') as f:
+            self._keys = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._keys_stat = self._stat_key(f.fileno())
+        with open(self._path(self.base, '.data'), 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        size = array('Q').itemsize
+        count = memoryview(self._keys)[:size].cast('Q')[0]
+        self._start = size * (count + 2)
+        self._key_offsets = memoryview(self._keys)[size:self._start].cast('Q')
+        self._data_offsets = memoryview(self._data)[len(self._data) - size * (count + 1):].cast('Q')
+        self._count = count
+
+    @staticmethod
+    def _stat_key(file) -> tuple:
+        st = os.stat(file)
+        return st.st_dev, st.st_ino, st.st_mtime_ns
+
+    @property
+    def stale(self) -> bool:
+        """`True` if the `.keys` and `.data` files were rebuilt or removed since they were mapped by this instance.
+
+        A stale instance keeps reading the pages of the files it mapped, which stay on disk as long as they are mapped.
+        """
+        try:
+            return self._stat_key(self._path(self.base, '.keys')) != self._keys_stat
+        except FileNotFoundError:
+            return True
+
+    @staticmethod
+    def _base(file: str) -> Path:
+        file = Path(file)
+        for suffix in _DICT_SUFFIXES:
+            if file.name.endswith(suffix):
+                return file.with_name(file.name[:-len(suffix)])
+        return file
+
+    @staticmethod
+    def _path(base: Path, suffix: str) -> Path:
+        # not `with_suffix`, which would replace any dotted part of the name
+        return base.with_name(base.name + suffix)
+
+    @classmethod
+    def build(cls, file: str, wikidict: Optional[Dict[str, str]] = None) -> None:
+        """
+        Write the `.keys` and `.data` files for the dictionary stored in `file`.
+
+        Missing wikitexts (`None`) are stored as empty.
+
+        Args:
+            file: Path to the file of the dictionary.
+            wikidict: The dictionary itself. If `None`, it is loaded from `file`.
+        """
+        if wikidict is None:
+            wikidict = WikiDump.load_wikidict_by_ns(file=file)
+        base = cls._base(file)
+
+        keys = sorted((title.encode('utf-8'), title) for title in wikidict)
+        key_offsets = array('Q', [0])
+        data_offsets = array('Q', [0])
+
+        # write to temporary files and replace the old ones, so that instances still mapping them are not affected
+        data, keys_file = cls._path(base, '.data'), cls._path(base, '.keys')
+        data_tmp, keys_tmp = data.with_name(data.name + '.tmp'), keys_file.with_name(keys_file.name + '.tmp')
+
+        with open(data_tmp, 'wb') as f:
+            for _, title in keys:
+                f.write((wikidict[title] or '').encode('utf-8'))
+                data_offsets.append(f.tell())
+            # align the trailing offsets
+            f.write(b'\0' * (-f.tell() % data_offsets.itemsize))
+            f.write(data_offsets.tobytes())
+
+        for key, _ in keys:
+            key_offsets.append(key_offsets[-1] + len(key))
+
+        with open(keys_tmp, 'wb') as f:
+            f.write(array('Q', [len(keys)]).tobytes())
+            f.write(key_offsets.tobytes())
+            for key, _ in keys:
+                f.write(key)
+
+        # the `.keys` file last: a `.keys` file newer than its `.data` file marks a complete pair
+        data_tmp.replace(data)
+        keys_tmp.replace(keys_file)
+
+    @classmethod
+    def load_by_ns(cls, file: str = None, ns: str = '0') -> 'WikiDumpMmap':
+        """
+        Open the memory-mapped dictionary for the dictionary file `file`.
+
+        The `.keys` and `.data` files are (re)built if they are missing, older than the dictionary file, or if the `.keys` file is older than the `.data` file (an interrupted build).
+
+        Args:
+            file: The path to the dictionary file. If `None`, the file returned by [`WikiDump.wikidict_file`][de_wiktio.fetch.WikiDump.wikidict_file] will be used.
+            ns: The wikinamespace identifier (e.g., `'0'` for content pages, `'108'` for Flexion pages).
+
+        Returns:
+            A `WikiDumpMmap` object.
+
+        Raises:
+            FileNotFoundError: If the dictionary file does not exist.
+        """
+        file = WikiDump._wikidict_file(file, ns)
+        base = cls._base(file)
+        mtime = file.stat().st_mtime_ns
+        # `build` replaces the `.data` file first and the `.keys` file last
+        for p in (cls._path(base, '.data'), cls._path(base, '.keys')):
+            if not p.exists() or p.stat().st_mtime_ns < mtime:
+                cls.build(file)
+                break
+            mtime = p.stat().st_mtime_ns
+        return cls(file)
+
+    def _title(self, i: int) -> bytes:
+        return self._keys[self._start + self._key_offsets[i]:self._start + self._key_offsets[i + 1]]
+
+    def __getitem__(self, key: bytes) -> bytes:
+        i = bisect.bisect_left(range(self._count), key, key=self._title)
+        if i == self._count or self._title(i) != key:
+            raise KeyError(key)
+        return self._data[self._data_offsets[i]:self._data_offsets[i + 1]]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[bytes]:
+        for i in range(self._count):
+            yield self._title(i)
+
+    def __reduce__(self):
+        return (type(self), (self.base,))
+
+
 class PageExport:
     """This class provides methods to fetch and parse the XML content of a Wiktionary page and to extract the *wikitext* using the export tool (Spezial:Exportieren).  
     """
-    def __init__(self, title: str) -> None:
+    def __init__(self, title: str, cache: bool = False) -> None:
         """"
         Initialize the PageExport class.
 
         Args:
             title: The title of the Wiktionary page to fetch.
+            cache: If `True`, the XML content is cached, see `fetch`.
 
         Raises:
             requests.exceptions.RequestException: If the request fails.
         """
         self.title: str = title
-        self.xml = self.fetch()
+        self.xml = self.fetch(cache)
         self.root = ET.fromstring(self.xml)
         self.namespaces = self.root.nsmap 
+        uri = ET.QName(self.root).namespace
+        self.page = self.root.find(_clark('page', uri))
+        if self.page is None:
+            self.ns = self.wikitext = ''
+        else:
+            self.ns = self.page.findtext(_clark('ns', uri), '')
+            self.wikitext = self.page.findtext(f"{_clark('revision', uri)}/{_clark('text', uri)}", '')
 
         # Instance attributes docstring 
         self.title: str
@@ -187,65 +595,89 @@ class PageExport:
         "The root element of the tree."
         self.namespaces: Dict[str, str]
         "Dictionary of XML namespaces of the root element."
+        self.page: Optional[ET.Element]
+        "The page element, or `None` if the page does not exist."
+        self.ns: str
+        "The Wiki namespace of the page as a string. If not found, an empty string."
+        self.wikitext: str
+        "The *wikitext* of the page as a string. If not found, an empty string."
  
 
-    def fetch(self) -> bytes:
+    def fetch(self, cache: bool = False) -> bytes:
         """
         Fetch and return the XML content of a Wiktionary page using the export tool.
 
         The XML data is retrieved using the following URL:
         `https://de.wiktionary.org/wiki/Spezial:Exportieren/{self.title}`
 
+        Args:
+            cache: If `True`, the XML content is looked up in the cache first, and cached once fetched. The cache is kept in memory during the session and, if `CACHE_DIR` is set in `Settings`, as gzipped files in that folder.
  
         Returns:
             the response.content - The XML content of the requested Wiktionary page.
 
         Raises:
-            requests.exceptions.RequestException: If the request fails.
+            requests.exceptions.RequestException: If the request fails, including error responses (`requests.exceptions.HTTPError`), whether `cache` is `True` or not.
         """
-        url = f'https://de.wiktionary.org/wiki/Spezial:Exportieren/{self.title}'
-        resp = requests.get(url)
-        resp.raise_for_status()
-        return resp.content 
-    
-    @property
-    def page(self) -> ET.Element:
-        """The page element."""
-        return self.root.find('page', namespaces=self.namespaces)
-    
-    @property
-    def wikitext(self) -> str:
-        """The *wikitext* of the page as a string.
+        if cache:
+            return _cached_fetch('export', self.title)
+        return _fetch_export(self.title)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the cache of fetched pages, in memory and in the `CACHE_DIR` folder indicated in `Settings`.
         
-        If not found, an empty string is returned.
+        This cache is shared by `PageExport.fetch` and `fetch_page_Action_API`. Only the files written by the cache are removed from `CACHE_DIR`.
         """
-        if self.page is None:
-            return ''
-        
-        wikitext_element = self.page.find('revision/text', namespaces=self.namespaces)
+        _cached_fetch.cache_clear()
+        cache_dir = Settings.get('CACHE_DIR')
+        if cache_dir is not None and Path(cache_dir).exists():
+            # only the cached files, and the temporary files left by interrupted writes, not other files of the folder
+            for file in Path(cache_dir).iterdir():
+                if _CACHE_FILE_RE.fullmatch(file.name):
+                    file.unlink()
+
+
+def _fetch_export(title: str) -> bytes:
+    """Return the XML content of the page `title` from the export tool."""
+    url = f'https://de.wiktionary.org/wiki/Spezial:Exportieren/{title}'
+    resp = _SESSION.get(url, timeout=_TIMEOUT)
+    resp.raise_for_status()
+    return resp.content
 
-        if wikitext_element is None:
-            return ''
-        
-        return wikitext_element.text
-    
-    @property
-    def ns(self) -> str:
-        """The Wiki namespace of the page as a string.
 
-        If not found, an empty string is returned.
-        """
-        if self.page is None:
-            return ''
+_CACHE_SUFFIX = '.xml.gz'
 
-        ns_element = self.page.find('ns', namespaces=self.namespaces)
-        if ns_element is None:
-            return ''
-        
-        return ns_element.text
+_CACHE_FILE_RE = re.compile(r'[0-9a-f]{40}' + re.escape(_CACHE_SUFFIX) + r'(\.tmp)?')
+"""Pattern matching the names of the cached files, see `_cached_fetch`."""
+
+
+@lru_cache(maxsize=4096)
+def _cached_fetch(kind: str, title: str) -> bytes:
+    """Return the XML content of the page `title` from the export tool (`kind` 'export') or the Action API (`kind` 'api').
+
+    The content is looked up in the `CACHE_DIR` folder indicated in `Settings` first, and saved there once fetched. If `CACHE_DIR` is not set, it is only cached in memory.
+    Failed requests raise an error and are not cached.
+    """
+    fetch = _fetch_export if kind == 'export' else _query_export
+    cache_dir = Settings.get('CACHE_DIR')
+    if cache_dir is None:
+        return fetch(title)
 
+    file = Path(cache_dir) / (hashlib.sha1(f'{kind}:{title}'.encode()).hexdigest() + _CACHE_SUFFIX)
+    if file.exists():
+        return gzip.decompress(file.read_bytes())
 
-def fetch_page_Action_API(title:str)-> bytes:
+    xml = fetch(title)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    # written to a temporary file first, so that a cached file is never incomplete
+    tmp = file.with_name(file.name + '.tmp')
+    tmp.write_bytes(gzip.compress(xml, compresslevel=_GZIP_LEVEL))
+    tmp.replace(file)
+    return xml
+
+
+def fetch_page_Action_API(title:str, cache: bool = False)-> bytes:
     """Fetch online and return the XML content of a Wiktionary page for the given title using the Action API.
 
     The XML data is retrieved from base URL:
@@ -253,22 +685,82 @@ def fetch_page_Action_API(title:str)-> bytes:
 
     Args:
         title: The title of the Wiktionary page to fetch.
+        cache: If `True`, the XML content is looked up in the cache first, and cached once fetched (see [`PageExport.fetch`][de_wiktio.fetch.PageExport.fetch]).
 
     Returns:
         bytes: The XML content of the requested Wiktionary page.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails, including error responses (`requests.exceptions.HTTPError`), whether `cache` is `True` or not.
     """
-    url = "https://de.wiktionary.org/w/api.php"
+    if cache:
+        return _cached_fetch('api', title)
+    return _query_export(title)
+
+
+def fetch_pages_Action_API(titles: Sequence[str]) -> bytes:
+    """Fetch online and return the XML content of several Wiktionary pages using the Action API.
+
+    The titles are requested in batches of 50, the maximum allowed by the Action API, and the pages of all batches are merged into one XML document.
+
+    Args:
+        titles: The titles of the Wiktionary pages to fetch.
+
+    Returns:
+        bytes: The XML content of the requested Wiktionary pages, or an empty bytes string if `titles` is empty.
 
+    Raises:
+        requests.exceptions.RequestException: If the request of any batch fails, including error responses (`requests.exceptions.HTTPError`).
+    """
+    root = None
+    for i in range(0, len(titles), _API_MAX_TITLES):
+        batch_root = ET.fromstring(_query_export("|".join(titles[i:i + _API_MAX_TITLES])))
+        if root is None:
+            root = batch_root
+        else:
+            root.extend(batch_root.findall(_clark('page', ET.QName(batch_root).namespace)))
+
+    if root is None:
+        return b''
+    return ET.tostring(root, encoding='utf-8', xml_declaration=True)
+
+
+def _query_export(titles: str) -> bytes:
+    """Return the XML export of the pages `titles` (separated by '|') from the Action API.
+    
+    An error response raises `requests.exceptions.HTTPError` instead of being returned.
+    """
     params = {
-        "titles": title,
+        "titles": titles,
         "action": "query",
         "export": 1,
         "exportnowrap": 1
     }
 
-    resp = requests.get(url=url, params=params)
+    resp = _SESSION.get(url=_API_URL, params=params, timeout=_TIMEOUT)
+    resp.raise_for_status()
     return resp.content
 
+
+def fetch_many(titles: List[str], workers: int = 8, cache: bool = False) -> List[PageExport]:
+    """Fetch online the XML content of several Wiktionary pages concurrently, using the export tool.
+
+    The pages are fetched in a thread pool sharing the same HTTP session, see [`PageExport`][de_wiktio.fetch.PageExport].
+
+    Args:
+        titles: The titles of the Wiktionary pages to fetch.
+        workers: The maximum number of concurrent requests.
+        cache: If `True`, the XML content of the pages is looked up in the cache first, and cached once fetched (see [`PageExport.fetch`][de_wiktio.fetch.PageExport.fetch]).
+
+    Returns:
+        The `PageExport` objects, in the order of `titles`.
+
+    Raises:
+        requests.exceptions.RequestException: If a request fails.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(partial(PageExport, cache=cache), titles))
+
  
 def print_tags_tree(
                     elem: ET.Element,
@@ -288,29 +780,27 @@ def print_tags_tree(
         print_text: If True, print the text content of each element.
         max_children: The maximum number of children to print for the root element.
         max_level: The maximum depth of the tree to print.
-        _level: The current recursion level. This is used internally and should not be set by the user.
+        _level: The level of `elem` in the printed tree. This is used internally and should not be set by the user.
     """
-    tagname = ET.QName(elem).localname if only_tagnames else elem.tag
-    print(" " * 5 * _level, _level, tagname)
-
-    if print_attributes:
-        for attr in elem.attrib:
-            print(" " * 5 * (_level + 1), attr, "=", elem.attrib[attr])
-
-    if print_text:
-        if elem.text is not None and elem.text.strip():
-            print(" " * 5 * (_level + 1), elem.text)
-        
-    # Restrict depth
-    if _level + 1 <= max_level:
-        for child_index, child in enumerate(elem):
-            print_tags_tree(child,
-                print_attributes=print_attributes,
-                print_text=print_text,
-                only_tagnames=only_tagnames,
-                max_children=max_children,
-                max_level=max_level,
-                _level=_level + 1)
+    # Depth-first walk with an explicit stack, children are pushed in reverse to keep the document order
+    stack = [(elem, _level)]
+    while stack:
+        node, level = stack.pop()
+        tagname = ET.QName(node).localname if only_tagnames else node.tag
+        print(" " * 5 * level, level, tagname)
+
+        if print_attributes:
+            for attr in node.attrib:
+                print(" " * 5 * (level + 1), attr, "=", node.attrib[attr])
+
+        if print_text:
+            if node.text is not None and node.text.strip():
+                print(" " * 5 * (level + 1), node.text)
+
+        # Restrict depth
+        if level + 1 <= max_level:
+            children = list(node)
             # Limit number of children of the root element
-            if _level == 0 and child_index == max_children - 1:
-                break
\ No newline at end of file
+            if level == 0 and max_children > 0:
+                children = children[:max_children]
+            stack.extend((child, level + 1) for child in reversed(children))
@@ -2,8 +2,14 @@
 
 # %% imports
 from pathlib import Path    
+from typing import Optional
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # %% class
 class Settings:
     """Settings class for the de_wiktio package.
@@ -11,38 +17,63 @@ class Settings:
     Allowed keys: 
     - `XML_FILE`, for path to the XML dump file 
     - `DICT_PATH`, for path to the dictionary folder 
+    - `CACHE_DIR`, for path to the folder of the cache of fetched pages (optional)
     
     Settings are saved in the `config.json` file in the package folder. 
     If the configuration file does not exist, it will be created when `get` or `set` methods are called.
     """
     _package_folder = Path(__file__).parent
     _file = _package_folder / 'config.json'
+    _cache: Optional[dict] = None
+    _cache_stat: Optional[tuple] = None
  
     @classmethod
     def _load(cls):
+        # the file is only parsed again if it was modified since it was last read or written
         try:
-            with open(cls._file, 'r') as f:
-                return json.load(f)
+            stat = cls._stat()
         except FileNotFoundError:
             cls._create_file()
             return {}
+        if cls._cache is not None and stat == cls._cache_stat:
+            return cls._cache
+
+        if orjson is not None:
+            cls._cache = orjson.loads(cls._file.read_bytes())
+        else:
+            with open(cls._file, 'r', encoding='utf-8') as f:
+                cls._cache = json.load(f)
+        cls._cache_stat = stat
+        return cls._cache
+
+    @classmethod
+    def _stat(cls):
+        # the size too, as the modification time may not change on file systems with a coarse resolution
+        stat = cls._file.stat()
+        return stat.st_mtime_ns, stat.st_size
 
     @classmethod
     def _create_file(cls):
         with open(cls._file, 'w') as f:
             json.dump({}, f)
+        cls._cache, cls._cache_stat = {}, cls._stat()
         print(f"Created new configuration file: {cls._file}")
 
     @classmethod
     def _save_config(cls, config):
-        with open(cls._file, 'w') as f:
-            json.dump(config, f, indent=4)
+        if orjson is not None:
+            cls._file.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            # same layout and encoding as orjson, which only indents by 2 spaces
+            with open(cls._file, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2, ensure_ascii=False)
+        cls._cache, cls._cache_stat = config, cls._stat()
 
     @classmethod
     def get(cls, key, default=None) -> str:
         """Get a value from the configuration file.
         
-        Allowed keys are: `XML_FILE`, `DICT_PATH`."""
+        Allowed keys are: `XML_FILE`, `DICT_PATH`, `CACHE_DIR`."""
         config = cls._load()
         return config.get(key, default)
 
@@ -53,10 +84,11 @@ class Settings:
         Allowed keys: 
             - `XML_FILE`, for path to the XML dump file 
             - `DICT_PATH`, for path to the dictionary folder 
+            - `CACHE_DIR`, for path to the folder of the cache of fetched pages (optional)
         
         To delete a value, set it to `None`.
         """
-        config = cls._load()
+        config = dict(cls._load())
         config[key] = value
         cls._save_config(config)
 
@@ -0,0 +1,139 @@
+import pickle
+
+import pytest
+
+from de_wiktio import entry
+from de_wiktio.entry import Entry, EntryBatch, EntryFlexion, Status, WordForm, _parse
+
+WORDFORM = '''=== {{Wortart|Adjektiv|Deutsch}} ===
+
+{{Deutsch Adjektiv Übersicht
+|Positiv=stark
+}}
+
+{{Bedeutungen}}
+:[1] ''[[körperlich]]:'' mit viel [[Kraft]]
+:[2] {{K|übertragen}} [[intensiv]]<ref>a
+
+b</ref>
+
+{{Beispiele}}
+:[1] Er ist sehr stark.
+<!-- Kommentar -->
+
+{{Synonyme}}
+:[1] [[kräftig]], [[kraftvoll]]
+
+{{Sprichwörter}}
+
+{{Gegenwörter}}
+:[1] [[schwach]]
+{{Referenzen}}
+:[1] {{Ref-DWDS|stark}}
+'''
+
+NAMES = ['Bedeutungen', 'Beispiele', 'Synonyme', 'Sprichwörter', 'Gegenwörter', 'Referenzen', 'Fehlt']
+
+
+def _wordform(text=WORDFORM):
+    return WordForm(_parse(text))
+
+
+def _fallback(text=WORDFORM):
+    """A word form whose contents can only be found by searching the wikitext."""
+    wordform = _wordform(text)
+    wordform._content_index = {}
+    return wordform
+
+
+@pytest.mark.parametrize('name', NAMES)
+@pytest.mark.parametrize('strip_code', [True, False])
+def test_other_content_extract_node_walk_matches_regex(name, strip_code):
+    assert _wordform().other_content_extract(name, strip_code) == _fallback().other_content_extract(name, strip_code)
+
+
+@pytest.mark.parametrize('text', [
+    '=== {{Wortart|Verb|Deutsch}} ===\n\n{{Bedeutungen}}\n{{Beispiele}}\n:[1] a\n\n',
+    '=== {{Wortart|Verb|Deutsch}} ===\n\n{{Bedeutungen}}\n\n{{Beispiele}}\n:[1] a',
+    '=== {{Wortart|Verb|Deutsch}} ===\n\n{{Bedeutungen}}\n[[x]]\n\n{{Bedeutungen}}\n:[2] b\n\n',
+    '=== {{Wortart|Verb|Deutsch}} ===\n\n{{Bedeutungen}}\n\n\n:[1] a\n\n',
+    '=== {{Wortart|Verb|Deutsch}} ===\n{{Bedeutungen}}\n:[1] a\n\n',
+])
+def test_other_content_extract_edge_cases(text):
+    for name in ('Bedeutungen', 'Beispiele'):
+        for strip_code in (True, False):
+            assert _wordform(text).other_content_extract(name, strip_code) == _fallback(text).other_content_extract(name, strip_code)
+
+
+def test_other_content_extract_content():
+    wordform = _wordform()
+    assert wordform._content_nodes('Synonyme') is not None
+    assert wordform.other_content_extract('Synonyme') == '[1] kräftig, kraftvoll'
+    assert wordform.other_content_extract('Synonyme', strip_code=False) == ':[1] [[kräftig]], [[kraftvoll]]'
+    assert wordform.other_content_extract('Fehlt') is None
+
+
+@pytest.mark.parametrize('wordform', [_wordform, _fallback], ids=['node-walk', 'regex'])
+@pytest.mark.parametrize('strip_code', [True, False])
+def test_extract_many_matches_other_content_extract(wordform, strip_code):
+    expected = {name: wordform().other_content_extract(name, strip_code) for name in NAMES}
+    assert wordform().extract_many(NAMES, strip_code) == expected
+
+
+class _ParsedPos(EntryFlexion):
+    """EntryFlexion always finding the POS in the parsed templates."""
+    __slots__ = ()
+
+    def _pos_from_text(self):
+        return None
+
+
+FLEXION = '== Flexion:x ({{Sprache|Deutsch}}) ==\n'
+
+
+@pytest.mark.parametrize('text', [
+    FLEXION + '{{Deutsch Verb regelmäßig|a|b}}\n',
+    FLEXION + '{{Deutsch Adjektiv Positiv\n|Positiv=stark\n}}\n== x ({{Sprache|Englisch}}) ==\n{{English Verb}}\n',
+    FLEXION + '{{Deutsch Verb unregelmäßig|{{{Verb}}}}}\n',
+    FLEXION + '{{{Verb}}}\n',
+    FLEXION + '{{Deutsch Numerale|{{x}}}}\n',
+    FLEXION + '<!-- {{Deutsch Verb x}} -->\n{{Deutsch Adjektiv Positiv}}\n',
+    FLEXION + '{{Deutsch Verb regelmäßig}}\n{{Deutsch Adjektiv Positiv}}\n',
+    FLEXION + '=== Sub ===\n{{Deutsch Verb regelmäßig}}\n',
+    FLEXION + 'text\n',
+])
+def test_pos_from_text_matches_parsed_templates(text):
+    fast, parsed = EntryFlexion('Flexion:x', text), _ParsedPos('Flexion:x', text)
+    assert parsed._pos_from_text() is None
+    assert (fast.pos, fast.status) == (parsed.pos, parsed.status)
+
+
+def test_pos_from_text_skips_template_arguments():
+    flexion = EntryFlexion('Flexion:x', FLEXION + '{{Deutsch Verb unregelmäßig|{{{Verb}}}}}\n')
+    assert flexion._pos_from_text() is None
+    assert flexion.pos == ['Verb']
+    assert flexion.status == Status.OK
+
+
+@pytest.fixture
+def batch(tmp_path, monkeypatch):
+    file = tmp_path / 'wikidict_0.pkl'
+    with open(file, 'wb') as f:
+        pickle.dump({'stark': '== stark ({{Sprache|Deutsch}}) ==\n' + WORDFORM}, f)
+    monkeypatch.delitem(entry._WIKIDICTS, Entry.NS, raising=False)
+    batch = EntryBatch(Entry, dict_path=tmp_path)
+    batch.extend_from_dump(['stark', 'fehlt', 'stark'])
+    return batch
+
+
+def test_entry_batch_view(batch, capsys):
+    assert [e.status for e in (batch[0], batch[1], batch[-1])] == [Status.OK, Status.NO_DUMP_CONTENT, Status.OK]
+    assert batch[0].wordforms[0].pos == ['Adjektiv']
+    assert batch[1].wordforms == []
+    assert capsys.readouterr().out == ''
+
+
+def test_entry_batch_slice(batch):
+    assert [(e.title, e.status) for e in batch[1:]] == [('fehlt', Status.NO_DUMP_CONTENT), ('stark', Status.OK)]
+    assert [e.title for e in batch[::-2]] == ['stark', 'stark']
+    assert batch[5:] == []
@@ -0,0 +1,257 @@
+import os
+import pickle
+import sys
+
+import lxml.etree as ET
+import pytest
+import requests
+
+from de_wiktio import fetch
+from de_wiktio.fetch import PageExport, WikiDump, WikiDumpMmap
+from de_wiktio.settings import Settings
+
+
+@pytest.mark.parametrize('wikidict', [
+    {},
+    {'stark': '{{Sprache|Deutsch}}', 'Übermut': 'ä ö ü ß', 'größer': None, '日本': '語', 'a': ''},
+])
+def test_wikidumpmmap_round_trip(tmp_path, wikidict):
+    file = tmp_path / 'wikidict_0.pkl'
+    with open(file, 'wb') as f:
+        pickle.dump(wikidict, f)
+    WikiDumpMmap.build(file, wikidict)
+
+    mm = WikiDumpMmap.load_by_ns(file)
+    expected = {title.encode('utf-8'): (text or '').encode('utf-8') for title, text in wikidict.items()}
+    assert len(mm) == len(expected)
+    assert list(mm) == sorted(expected)
+    assert dict(mm.items()) == expected
+    assert b'missing' not in mm
+    with pytest.raises(KeyError):
+        mm[b'missing']
+    assert dict(pickle.loads(pickle.dumps(mm)).items()) == expected
+
+
+def test_wikidumpmmap_files_per_dict_file(tmp_path):
+    # dotted names must not share the .keys and .data files of another dictionary
+    file, backup = tmp_path / 'wikidict_0.pkl', tmp_path / 'wikidict_0.backup.pkl'
+    for f, wikidict in ((file, {'a': 'new'}), (backup, {'a': 'old'})):
+        with open(f, 'wb') as fh:
+            pickle.dump(wikidict, fh)
+
+    assert WikiDumpMmap.load_by_ns(file)[b'a'] == b'new'
+    assert WikiDumpMmap.load_by_ns(backup)[b'a'] == b'old'
+    assert (tmp_path / 'wikidict_0.keys').exists()
+    assert (tmp_path / 'wikidict_0.backup.keys').exists()
+
+
+def test_wikidumpmmap_rebuild_while_mapped(tmp_path):
+    file = tmp_path / 'wikidict_0.pkl'
+    with open(file, 'wb') as f:
+        pickle.dump({'a': 'old', 'b': 'x' * 10_000}, f)
+    mm = WikiDumpMmap.load_by_ns(file)
+    assert not mm.stale
+
+    # a smaller dictionary would truncate the files mapped by `mm` if they were rewritten in place
+    WikiDumpMmap.build(file, {'a': 'new'})
+    assert mm.stale
+    assert mm[b'a'] == b'old'
+    assert mm[b'b'] == b'x' * 10_000
+    assert dict(WikiDumpMmap.load_by_ns(file).items()) == {b'a': b'new'}
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_wikidumpmmap_rebuilds_interrupted_build(tmp_path):
+    file = tmp_path / 'wikidict_0.pkl'
+    with open(file, 'wb') as f:
+        pickle.dump({'a': 'new'}, f)
+    WikiDumpMmap.build(file, {'a': 'old'})
+
+    # a build interrupted after replacing the `.data` file leaves an older `.keys` file
+    keys, data = tmp_path / 'wikidict_0.keys', tmp_path / 'wikidict_0.data'
+    stat = data.stat()
+    os.utime(keys, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1))
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 2))
+    assert WikiDumpMmap.load_by_ns(file)[b'a'] == b'new'
+
+
+DUMP = '''<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.11/" version="0.11" xml:lang="de">
+  <siteinfo>
+    <sitename>Wiktionary</sitename>
+    <namespaces>
+      <namespace key="0" case="case-sensitive" />
+      <namespace key="108" case="case-sensitive">Flexion</namespace>
+    </namespaces>
+  </siteinfo>
+  <page>
+    <title>stark</title>
+    <ns>0</ns>
+    <id>1</id>
+    <revision>
+      <id>10</id>
+      <text bytes="38" xml:space="preserve">== stark ({{Sprache|Deutsch}}) ==
+&lt;b&gt; &amp; Ü</text>
+    </revision>
+  </page>
+  <page>
+    <title>leer</title>
+    <ns>0</ns>
+    <id>2</id>
+    <revision>
+      <id>20</id>
+      <text bytes="0" xml:space="preserve" />
+    </revision>
+    <revision>
+      <id>21</id>
+      <text bytes="5" xml:space="preserve">zweite</text>
+    </revision>
+  </page>
+  <page>
+    <title>gehen</title>
+    <ns>0</ns>
+    <id>3</id>
+    <revision>
+      <id>30</id>
+      <text bytes="5" xml:space="preserve"><![CDATA[{{Verb}} <tag>]]></text>
+    </revision>
+    <revision>
+      <id>31</id>
+      <text bytes="5" xml:space="preserve">alt</text>
+    </revision>
+  </page>
+  <page>
+    <title>Flexion:gehen</title>
+    <ns>108</ns>
+    <id>4</id>
+    <revision>
+      <id>40</id>
+      <text bytes="22" xml:space="preserve">{{Deutsch Verb regelmäßig}}</text>
+    </revision>
+  </page>
+  <page>
+    <title>Ging</title>
+    <ns>0</ns>
+    <id>5</id>
+    <redirect title="gehen" />
+    <revision>
+      <id>50</id>
+      <text bytes="15" xml:space="preserve">#WEITERLEITUNG [[gehen]]</text>
+    </revision>
+  </page>
+  <page>
+    <title>Gingen</title>
+    <ns>0</ns>
+    <id>6</id>
+    <redirect title="gehen" />
+    <revision>
+      <id>60</id>
+      <text bytes="15" xml:space="preserve">#WEITERLEITUNG [[gehen]]</text>
+    </revision>
+  </page>
+</mediawiki>
+'''
+
+
+@pytest.fixture
+def dump(tmp_path):
+    file = tmp_path / 'dump.xml'
+    file.write_text(DUMP, encoding='utf-8')
+    return WikiDump(file)
+
+
+def _tree_dict(dump, ns):
+    """The dictionary of `ns` built from the page elements, as `create_dict_by_ns` used to."""
+    return {page.findtext('{*}title'): page.find('{*}revision/{*}text').text for page in dump.pages_by_ns(ns)}
+
+
+@pytest.mark.parametrize('ns', ['0', '108', '1'])
+def test_create_dict_by_ns_matches_page_elements(tmp_path, dump, ns):
+    dic = dump.create_dict_by_ns(ns, dict_path=tmp_path)
+    assert dic == _tree_dict(dump, ns)
+
+
+def test_create_dict_by_ns_first_revision(tmp_path, dump):
+    dic = dump.create_dict_by_ns('0', dict_path=tmp_path)
+    assert dic['leer'] is None
+    assert dic['gehen'] == '{{Verb}} <tag>'
+    assert dic['stark'].endswith('<b> & Ü')
+    assert dic['Ging'] is dic['Gingen']
+
+
+def test_clear_cache_keeps_other_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(Settings, 'get', classmethod(lambda cls, key: tmp_path if key == 'CACHE_DIR' else None))
+    cached = tmp_path / ('0' * 40 + '.xml.gz')
+    others = [tmp_path / 'notes.xml.gz', tmp_path / 'dump.xml.gz.bak', tmp_path / ('A' * 40 + '.xml.gz')]
+    for file in [cached, cached.with_name(cached.name + '.tmp'), *others]:
+        file.write_bytes(b'')
+
+    PageExport.clear_cache()
+    assert sorted(tmp_path.iterdir()) == sorted(others)
+
+
+def test_fetch_many_cache(monkeypatch):
+    fetched = []
+    def fetch_export(title):
+        fetched.append(title)
+        return f'<mediawiki><page><title>{title}</title><ns>0</ns></page></mediawiki>'.encode()
+
+    monkeypatch.setattr(Settings, 'get', classmethod(lambda cls, key: None))
+    monkeypatch.setattr(fetch, '_fetch_export', fetch_export)
+    PageExport.clear_cache()
+    try:
+        for _ in range(2):
+            pages = fetch.fetch_many(['a', 'b', 'a'], workers=1, cache=True)
+            assert [page.ns for page in pages] == ['0'] * 3
+        assert sorted(fetched) == ['a', 'b']
+    finally:
+        PageExport.clear_cache()
+
+
+def _response(status_code, content):
+    resp = requests.Response()
+    resp.status_code, resp._content = status_code, content
+    return resp
+
+
+def test_fetch_pages_action_api_batches(monkeypatch):
+    def get(url, params, timeout):
+        pages = ''.join(f'<page><title>{title}</title></page>' for title in params['titles'].split('|'))
+        return _response(200, f'<mediawiki>{pages}</mediawiki>'.encode())
+
+    monkeypatch.setattr(fetch._SESSION, 'get', get)
+    titles = [str(i) for i in range(120)]
+    root = ET.fromstring(fetch.fetch_pages_Action_API(titles))
+    assert [page.findtext('title') for page in root] == titles
+
+
+def test_fetch_pages_action_api_raises_for_failed_batch(monkeypatch):
+    responses = iter([_response(200, b'<mediawiki><page/></mediawiki>'), _response(503, b'Service Unavailable')])
+    monkeypatch.setattr(fetch._SESSION, 'get', lambda url, params, timeout: next(responses))
+    with pytest.raises(requests.exceptions.HTTPError):
+        fetch.fetch_pages_Action_API([str(i) for i in range(60)])
+
+
+@pytest.mark.parametrize('ns', ['0', '108'])
+def test_create_dict_by_ns_parallel_matches_serial(tmp_path, dump, monkeypatch, ns):
+    serial = dump.create_dict_by_ns(ns, dict_path=tmp_path)
+    monkeypatch.setattr(fetch, '_PARALLEL_MIN_SIZE', 0)
+    parallel = dump.create_dict_by_ns(ns, dict_path=tmp_path, workers=2)
+    assert parallel == serial
+    assert list(parallel) == list(serial)
+    assert all(sys.intern(title) is title for title in parallel)
+    if ns == '0':
+        assert parallel['Ging'] is parallel['Gingen']
+
+
+@pytest.mark.parametrize('cut', [
+    DUMP.index('</page>', DUMP.index('<title>leer')) + len('</page>'),
+    DUMP.index('zweite'),
+], ids=['between-pages', 'inside-page'])
+def test_create_dict_by_ns_truncated(tmp_path, monkeypatch, cut):
+    file = tmp_path / 'dump.xml'
+    file.write_text(DUMP[:cut], encoding='utf-8')
+    with pytest.raises(ET.XMLSyntaxError):
+        WikiDump(file).create_dict_by_ns('0', dict_path=tmp_path)
+    monkeypatch.setattr(fetch, '_PARALLEL_MIN_SIZE', 0)
+    with pytest.raises(ValueError, match='complete'):
+        WikiDump(file).create_dict_by_ns('0', dict_path=tmp_path, workers=2)
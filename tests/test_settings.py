@@ -0,0 +1,62 @@
+import json
+import os
+
+import pytest
+
+from de_wiktio import settings
+from de_wiktio.settings import Settings
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def config(request, tmp_path, monkeypatch):
+    file = tmp_path / 'config.json'
+    monkeypatch.setattr(Settings, '_file', file)
+    monkeypatch.setattr(Settings, '_cache', None)
+    monkeypatch.setattr(Settings, '_cache_stat', None)
+    if request.param == 'json':
+        monkeypatch.setattr(settings, 'orjson', None)
+    elif settings.orjson is None:
+        pytest.skip('orjson is not installed')
+    return file
+
+
+def test_get_creates_file(config, capsys):
+    assert Settings.get('XML_FILE') is None
+    assert Settings.get('XML_FILE', 'default') == 'default'
+    assert json.loads(config.read_text()) == {}
+
+
+def test_set_then_get(config):
+    Settings.set('XML_FILE', '/dumps/dewiktionary-ä.xml')
+    Settings.set('DICT_PATH', '/dicts')
+    assert Settings.get('XML_FILE') == '/dumps/dewiktionary-ä.xml'
+    assert Settings.get('DICT_PATH') == '/dicts'
+    assert json.loads(config.read_text(encoding='utf-8')) == {'XML_FILE': '/dumps/dewiktionary-ä.xml', 'DICT_PATH': '/dicts'}
+
+    Settings.set('DICT_PATH', None)
+    assert Settings.get('DICT_PATH') is None
+
+
+def test_same_file_layout_with_and_without_orjson(config):
+    Settings.set('XML_FILE', '/dumps/ä.xml')
+    assert config.read_text(encoding='utf-8') == '{\n  "XML_FILE": "/dumps/ä.xml"\n}'
+
+
+def test_get_after_external_edit(config):
+    Settings.set('XML_FILE', '/old.xml')
+    assert Settings.get('XML_FILE') == '/old.xml'
+
+    config.write_text(json.dumps({'XML_FILE': '/new.xml'}))
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert Settings.get('XML_FILE') == '/new.xml'
+
+
+def test_get_after_external_edit_same_mtime(config):
+    Settings.set('XML_FILE', '/old.xml')
+    stat = config.stat()
+
+    # on file systems with a coarse resolution, an edit may keep the modification time
+    config.write_text(json.dumps({'XML_FILE': '/newer.xml'}))
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert Settings.get('XML_FILE') == '/newer.xml'